@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import hashlib
 from textwrap import dedent
 from time import time
 
 import streamlit as st
+from openai import OpenAI, OpenAIError
 
 from vi_speech_to_text.openai_client import MissingAPIKeyError, create_openai_client
 from vi_speech_to_text.postprocess import (
+    LATEX_PROMPT_VERSION,
     DocumentGenerationError,
     GeneratedDocument,
     generate_latex_documents,
+    poll_latex_batch,
+    submit_latex_batch,
 )
+from vi_speech_to_text.postprocess_cache import compile_pdf_cached
 from vi_speech_to_text.transcription import (
     ChunkTranscript,
     UnsupportedAudioFormatError,
@@ -21,16 +27,24 @@ from vi_speech_to_text.transcription import (
 )
 
 DEFAULT_MODEL = "gpt-4o-transcribe"
+# Fixed at import time; avoids rebuilding the list on every rerun.
+SUPPORTED_EXTENSIONS = tuple(supported_audio_extensions())
+# Finished transcripts kept in memory so re-running the same file skips the API.
+_TRANSCRIPT_CACHE_SIZE = 16
 
 
 def build_streamlit_app() -> None:
     """Render the Streamlit interface."""
 
     st.set_page_config(page_title="VI Speech-to-Text", page_icon=":studio_microphone:")
-    state = st.session_state.setdefault(
-        "transcription_state",
-        {"transcript": "", "documents": [], "error": ""},
-    )
+    if "transcription_state" not in st.session_state:
+        st.session_state.transcription_state = {
+            "transcript": "",
+            "documents": [],
+            "error": "",
+            "batch_id": "",
+        }
+    state = st.session_state.transcription_state
     st.header("VI Speech-to-Text")
     st.caption("Chunk long audio files and send them to gpt-4o-transcribe.")
 
@@ -52,7 +66,7 @@ def build_streamlit_app() -> None:
 
     uploaded_file = st.file_uploader(
         "Upload audio",
-        type=supported_audio_extensions(),
+        type=SUPPORTED_EXTENSIONS,
         accept_multiple_files=False,
         help="Files larger than 25 MB are automatically chunked to satisfy the API limit.",
     )
@@ -60,22 +74,81 @@ def build_streamlit_app() -> None:
     if not uploaded_file:
         st.info("Choose an audio file to enable transcription.")
 
+    batch_mode = st.toggle(
+        "Background mode (Batch API)",
+        help=(
+            "Queue the LaTeX generation on the OpenAI Batch API: about half the cost, "
+            "but results can take up to 24 hours. Keep this tab open to collect them."
+        ),
+    )
+
     if st.button("Transcribe", type="primary", disabled=not uploaded_file):
-        _handle_transcription(uploaded_file, prompt, state)
+        _handle_transcription(uploaded_file, prompt, state, batch_mode=batch_mode)
+
+    if state.get("batch_id"):
+        _poll_latex_batch(state)
 
     _render_results(state)
 
 
-def _handle_transcription(uploaded_file, prompt: str, state: dict) -> None:
+@st.cache_resource(show_spinner=False)
+def _get_openai_client() -> OpenAI:
+    """Share one OpenAI client (and its connection pool) across reruns and sessions."""
+
+    return create_openai_client()
+
+
+def _handle_transcription(uploaded_file, prompt: str, state: dict, *, batch_mode: bool) -> None:
     try:
-        client = create_openai_client()
+        client = _get_openai_client()
     except MissingAPIKeyError as exc:  # pragma: no cover - UI feedback only
         st.error(str(exc))
         return
 
+    audio_digest = hashlib.sha256(uploaded_file.getbuffer()).hexdigest()
+    cache_key = (audio_digest, prompt.strip(), DEFAULT_MODEL)
+    transcripts = _transcript_cache()
+    transcript_text = transcripts.get(cache_key)
+    if transcript_text is not None:
+        st.success("Reused the transcript from an earlier run on this audio file.")
+    else:
+        transcript_text = _transcribe_with_progress(uploaded_file, prompt, client)
+        if transcript_text is None:
+            return
+        if len(transcripts) >= _TRANSCRIPT_CACHE_SIZE:
+            transcripts.pop(next(iter(transcripts), None), None)
+        transcripts[cache_key] = transcript_text
+
+    state["transcript"] = transcript_text
+    state["error"] = ""
+    state["batch_id"] = ""
+
+    if batch_mode:
+        state["documents"] = []
+        try:
+            state["batch_id"] = submit_latex_batch(transcript_text, client)
+        except OpenAIError as exc:  # pragma: no cover - UI feedback only
+            state["error"] = f"Failed to queue the LaTeX batch: {exc}"
+            st.error(state["error"])
+        return
+
+    with st.spinner("Generating LaTeX study notes and spoken-style script..."):
+        try:
+            documents = _generate_latex_documents_cached(transcript_text, LATEX_PROMPT_VERSION)
+        except DocumentGenerationError as exc:
+            state["documents"] = []
+            state["error"] = str(exc)
+            st.error(state["error"])
+            return
+
+    state["documents"] = documents
+
+
+def _transcribe_with_progress(uploaded_file, prompt: str, client: OpenAI) -> str | None:
     status = st.empty()
     progress = st.progress(0.0)
-    chunk_details: list[ChunkTranscript] = []
+    transcript_parts: list[str] = []
+    chunk_count = 0
     start_time = time()
 
     try:
@@ -86,7 +159,9 @@ def _handle_transcription(uploaded_file, prompt: str, state: dict) -> None:
             client=client,
             model=DEFAULT_MODEL,
         ):
-            chunk_details.append(chunk)
+            chunk_count += 1
+            if chunk.text:
+                transcript_parts.append(chunk.text)
             progress.progress(chunk.progress)
             status.info(
                 _format_status_message(
@@ -98,34 +173,60 @@ def _handle_transcription(uploaded_file, prompt: str, state: dict) -> None:
 
     except UnsupportedAudioFormatError as exc:
         st.error(str(exc))
-        return
+        return None
     except ValueError as exc:
         st.error(str(exc))
-        return
+        return None
 
     progress.progress(1.0)
     status.success(
-        f"Completed transcription in {len(chunk_details)} chunk(s) using {DEFAULT_MODEL}."
+        f"Completed transcription in {chunk_count} chunk(s) using {DEFAULT_MODEL}."
     )
 
-    transcript_text = "\n\n".join(chunk.text for chunk in chunk_details if chunk.text).strip()
+    # Chunk texts arrive stripped, so a single join yields the final transcript.
+    transcript_text = "\n\n".join(transcript_parts)
 
     if not transcript_text:
         st.info("The transcription API did not return any text for this audio.")
-        return
+        return None
+    return transcript_text
 
-    state["transcript"] = transcript_text
-    state["error"] = ""
 
-    with st.spinner("Generating LaTeX study notes and spoken-style script..."):
-        try:
-            documents = generate_latex_documents(transcript_text, client)
-        except DocumentGenerationError as exc:
-            state["documents"] = []
-            state["error"] = str(exc)
-            st.error(state["error"])
-            return
+@st.cache_resource(show_spinner=False)
+def _transcript_cache() -> dict[tuple[str, str, str], str]:
+    """Finished transcripts keyed by (audio SHA-256, prompt, model), shared across sessions."""
+
+    return {}
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _generate_latex_documents_cached(
+    transcript: str, prompt_version: int
+) -> list[GeneratedDocument]:
+    """Memoize LaTeX generation per transcript; prompt_version invalidates on prompt edits."""
+
+    return generate_latex_documents(transcript, compiler=compile_pdf_cached)
+
+
+def _poll_latex_batch(state: dict) -> None:
+    batch_id = state["batch_id"]
+    try:
+        with st.spinner("Checking the LaTeX batch..."):
+            documents = poll_latex_batch(
+                batch_id, _get_openai_client(), compiler=compile_pdf_cached
+            )
+    except (DocumentGenerationError, MissingAPIKeyError, OpenAIError) as exc:
+        state["batch_id"] = ""
+        state["documents"] = []
+        state["error"] = str(exc)
+        return
+
+    if documents is None:
+        st.info(f"LaTeX batch `{batch_id}` is still processing. Check back later.")
+        st.button("Check batch status")
+        return
 
+    state["batch_id"] = ""
     state["documents"] = documents
 
 
@@ -152,7 +253,7 @@ def _render_documents(documents: list[GeneratedDocument]) -> None:
         st.markdown(f"### {doc.title}")
         st.download_button(
             label="Pobierz LaTeX",
-            data=doc.latex.encode("utf-8"),
+            data=doc.latex_bytes,
             file_name=doc.latex_filename,
             mime="application/x-tex",
             key=f"download-latex-{doc.key}",
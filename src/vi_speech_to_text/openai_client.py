@@ -6,13 +6,22 @@ import os
 from typing import Optional
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    AsyncOpenAI,
+    InternalServerError,
+    OpenAI,
+    RateLimitError,
+)
 
 
 class MissingAPIKeyError(RuntimeError):
     """Raised when no OpenAI API key is configured."""
 
 
+# Transient API failures worth retrying with backoff (timeouts subclass APIConnectionError).
+RETRYABLE_API_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
 load_dotenv()
 
 
@@ -30,3 +39,10 @@ def create_openai_client(api_key: Optional[str] = None) -> OpenAI:
 
     resolved_key = _resolve_api_key(api_key)
     return OpenAI(api_key=resolved_key)
+
+
+def create_async_openai_client(api_key: Optional[str] = None) -> AsyncOpenAI:
+    """Instantiate an asyncio OpenAI client using the provided or environment API key."""
+
+    resolved_key = _resolve_api_key(api_key)
+    return AsyncOpenAI(api_key=resolved_key)
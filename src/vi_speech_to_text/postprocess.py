@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import os
+import re
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from tempfile import TemporaryDirectory
-from typing import Iterable, List, Sequence
+from typing import Callable, List, Optional, Sequence
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from vi_speech_to_text.openai_client import RETRYABLE_API_ERRORS, create_async_openai_client
 
 STUDY_NOTES_PROMPT = """You are a language model that converts lecture transcripts into well-formatted LaTeX study notes that can be compiled into a clean, readable PDF.
 
@@ -318,6 +325,7 @@ class GeneratedDocument:
     key: str
     title: str
     latex: str
+    latex_bytes: bytes
     pdf_bytes: bytes
     latex_filename: str
     pdf_filename: str
@@ -327,28 +335,112 @@ class DocumentGenerationError(RuntimeError):
     """Raised when GPT or PDF generation fails."""
 
 
-def generate_latex_documents(transcript: str, client: OpenAI) -> List[GeneratedDocument]:
-    """Create both LaTeX variants and compile them to PDFs in parallel."""
+PdfCompiler = Callable[[str], bytes]
+
+
+_LATEX_MODEL = "gpt-4.1"
+
+# A full lecture's LaTeX can take minutes to generate, so allow a generous per-request
+# timeout and retry transient failures (429s, timeouts, 5xx) with exponential backoff.
+_GPT_TIMEOUT_S = 300.0
+_GPT_ATTEMPTS = 3
+_RETRY_BASE_DELAY_S = 2.0
+
+# Bump whenever the prompts or model change so cached LaTeX output is invalidated.
+LATEX_PROMPT_VERSION = 1
+
+# pdflatex passes are repeated until the TOC/label data settles, up to this many runs.
+_MAX_PDFLATEX_PASSES = 3
+_AUX_SUFFIXES = (".aux", ".toc", ".out")
+# Warnings LaTeX and packages emit when another pass is needed. A bare b"Rerun" is not
+# enough: hyperref loads rerunfilecheck, whose "Rerun checks for auxiliary files" banner
+# is in every log.
+_RERUN_PATTERN = re.compile(rb"Rerun to get|may have changed\. ?Rerun|Rerun LaTeX")
+
+# Keep pdflatex scratch files in RAM where the platform offers a tmpfs (Linux /dev/shm).
+_TEX_SCRATCH_ROOT = (
+    "/dev/shm" if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK) else None
+)
+
+# Batch jobs that are still queued or running; anything else is terminal.
+_PENDING_BATCH_STATUSES = {"validating", "in_progress", "finalizing"}
+# The fused batch request returns both documents in one output, so give it gpt-4.1's full
+# output allowance instead of the model default.
+_BATCH_MAX_OUTPUT_TOKENS = 32_768
+
+_LATEX_TASKS: Sequence[tuple[str, str, str]] = (
+    ("study-notes", "LaTeX – notatki", STUDY_NOTES_PROMPT),
+    ("spoken-script", "LaTeX – zapis mówiony", SPOKEN_STYLE_PROMPT),
+)
+
+# Batch mode fuses both variants into one request so the transcript is billed once. The
+# interactive path keeps two requests: one response would generate both documents back to
+# back and roughly double the GPT wait.
+_COMBINED_KEY = "combined"
+_COMBINED_FIELDS = {key: key.replace("-", "_") for key, *_rest in _LATEX_TASKS}
+_COMBINED_PROMPT = (
+    "You will produce TWO independent LaTeX documents from the same lecture transcript and "
+    "return them together as a JSON object with the fields "
+    + ", ".join(f'"{field}"' for field in _COMBINED_FIELDS.values())
+    + ". Each field must hold the complete LaTeX source of its document and nothing else. "
+    "Each set of instructions below describes one document; wherever it says to answer with "
+    "LaTeX only, that applies to the content of the corresponding JSON field.\n\n"
+    + "\n".join(
+        f"=== INSTRUCTIONS FOR FIELD {_COMBINED_FIELDS[key]} ===\n\n{prompt}"
+        for key, _title, prompt in _LATEX_TASKS
+    )
+)
+_COMBINED_FORMAT = {
+    "type": "json_schema",
+    "name": "latex_documents",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {field: {"type": "string"} for field in _COMBINED_FIELDS.values()},
+        "required": list(_COMBINED_FIELDS.values()),
+        "additionalProperties": False,
+    },
+}
+
+
+def generate_latex_documents(
+    transcript: str,
+    client: Optional[AsyncOpenAI] = None,
+    *,
+    compiler: PdfCompiler | None = None,
+) -> List[GeneratedDocument]:
+    """Create both LaTeX variants concurrently, compiling each PDF as soon as it arrives.
+
+    ``compiler`` replaces :func:`compile_pdf`, e.g. with a memoized variant.
+    """
+
+    return asyncio.run(_generate_latex_documents(transcript, client, compiler or compile_pdf))
+
+
+async def _generate_latex_documents(
+    transcript: str, client: Optional[AsyncOpenAI], compiler: PdfCompiler
+) -> List[GeneratedDocument]:
+    if client is None:
+        # httpx async pools are bound to the event loop that created them, so a client
+        # cannot outlive the asyncio.run() call that drives this coroutine.
+        async with create_async_openai_client() as owned_client:
+            return await _generate_latex_documents(transcript, owned_client, compiler)
 
-    tasks: Sequence[tuple[str, str, str]] = (
-        ("study-notes", "LaTeX – notatki", STUDY_NOTES_PROMPT),
-        ("spoken-script", "LaTeX – zapis mówiony", SPOKEN_STYLE_PROMPT),
+    results = await asyncio.gather(
+        *(
+            _generate_single_document(key, title, prompt, transcript, client, compiler)
+            for key, title, prompt in _LATEX_TASKS
+        ),
+        return_exceptions=True,
     )
 
-    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
-        futures = {
-            executor.submit(_generate_single_document, key, title, prompt, transcript, client): key
-            for key, title, prompt in tasks
-        }
-
-        documents: list[GeneratedDocument] = []
-        errors: list[tuple[str, Exception]] = []
-        for future in as_completed(futures):
-            key = futures[future]
-            try:
-                documents.append(future.result())
-            except Exception as exc:  # pragma: no cover - surfaced to UI
-                errors.append((key, exc))
+    documents: list[GeneratedDocument] = []
+    errors: list[tuple[str, Exception]] = []
+    for (key, *_rest), result in zip(_LATEX_TASKS, results):
+        if isinstance(result, Exception):  # pragma: no cover - surfaced to UI
+            errors.append((key, result))
+        else:
+            documents.append(result)
 
     if errors:
         error_messages = "; ".join(f"{key}: {exc}" for key, exc in errors)
@@ -356,38 +448,150 @@ def generate_latex_documents(transcript: str, client: OpenAI) -> List[GeneratedD
             "Failed to generate all LaTeX documents: " + error_messages
         )
 
-    # Preserve original ordering from tasks tuple.
-    ordering = {key: index for index, (key, *_rest) in enumerate(tasks)}
-    documents.sort(key=lambda doc: ordering[doc.key])
     return documents
 
 
-def _generate_single_document(
-    key: str, title: str, prompt: str, transcript: str, client: OpenAI
+async def _generate_single_document(
+    key: str,
+    title: str,
+    prompt: str,
+    transcript: str,
+    client: AsyncOpenAI,
+    compiler: PdfCompiler,
 ) -> GeneratedDocument:
-    latex = _call_gpt_latex(prompt, transcript, client)
-    pdf_bytes = _compile_pdf(latex)
+    latex = await _call_gpt_latex(key, prompt, transcript, client)
+    # pdflatex blocks, so run it on a worker thread while the other request keeps streaming.
+    pdf_bytes = await asyncio.to_thread(compiler, latex)
+    return _build_document(key, title, latex, pdf_bytes)
+
+
+def submit_latex_batch(transcript: str, client: OpenAI) -> str:
+    """Queue both LaTeX variants as one fused Batch API request and return the batch id."""
+
+    body = _latex_request_body(_COMBINED_KEY, _COMBINED_PROMPT, transcript)
+    body["text"] = {"format": _COMBINED_FORMAT}
+    body["max_output_tokens"] = _BATCH_MAX_OUTPUT_TOKENS
+    line = json.dumps(
+        {"custom_id": _COMBINED_KEY, "method": "POST", "url": "/v1/responses", "body": body},
+        ensure_ascii=False,
+    )
+
+    input_file = client.files.create(
+        file=("latex-batch.jsonl", (line + "\n").encode("utf-8")), purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/responses",
+        completion_window="24h",
+    )
+    return batch.id
+
+
+def poll_latex_batch(
+    batch_id: str, client: OpenAI, *, compiler: PdfCompiler | None = None
+) -> Optional[List[GeneratedDocument]]:
+    """Return compiled documents once the batch finishes, or None while it is pending."""
+
+    batch = client.batches.retrieve(batch_id)
+    if batch.status in _PENDING_BATCH_STATUSES:
+        return None
+    if batch.status != "completed":
+        raise DocumentGenerationError(
+            f"LaTeX batch {batch_id} ended with status '{batch.status}'."
+        )
+    if not batch.output_file_id:
+        # Failed requests land in the batch error file instead of the output file.
+        raise DocumentGenerationError(f"LaTeX batch {batch_id} did not produce any output.")
+
+    lines = client.files.content(batch.output_file_id).text.splitlines()
+    try:
+        record = json.loads(next((line for line in lines if line.strip()), "{}"))
+    except json.JSONDecodeError as exc:
+        raise DocumentGenerationError("LaTeX batch output file is not valid JSONL.") from exc
+    response = record.get("response") or {}
+    if record.get("error") or response.get("status_code") != 200:
+        raise DocumentGenerationError(
+            f"LaTeX batch request failed: {record.get('error') or response.get('body')}"
+        )
+
+    body = response.get("body") or {}
+    if body.get("status") == "incomplete":
+        reason = (body.get("incomplete_details") or {}).get("reason") or "unknown reason"
+        raise DocumentGenerationError(
+            f"LaTeX batch output was truncated ({reason}); the transcript is too long to "
+            "return both documents in one batch response. Generate them without background "
+            "mode instead."
+        )
+
+    try:
+        fields = json.loads(_extract_batch_output_text(body))
+    except json.JSONDecodeError as exc:
+        raise DocumentGenerationError("LaTeX batch returned malformed JSON.") from exc
+
+    latexes = [str(fields.get(_COMBINED_FIELDS[key]) or "") for key, *_rest in _LATEX_TASKS]
+    empty = [key for (key, *_rest), latex in zip(_LATEX_TASKS, latexes) if not latex.strip()]
+    if empty:
+        raise DocumentGenerationError(
+            "GPT returned an empty LaTeX document for: " + ", ".join(empty)
+        )
+
+    with ThreadPoolExecutor(max_workers=len(latexes)) as executor:
+        pdfs = list(executor.map(compiler or compile_pdf, latexes))
+
+    return [
+        _build_document(key, title, latex, pdf_bytes)
+        for (key, title, _prompt), latex, pdf_bytes in zip(_LATEX_TASKS, latexes, pdfs)
+    ]
+
+
+def _build_document(key: str, title: str, latex: str, pdf_bytes: bytes) -> GeneratedDocument:
     return GeneratedDocument(
         key=key,
         title=title,
         latex=latex,
+        # Encoded once here so download buttons do not re-encode on every rerun.
+        latex_bytes=latex.encode("utf-8"),
         pdf_bytes=pdf_bytes,
         latex_filename=f"{key}.tex",
         pdf_filename=f"{key}.pdf",
     )
 
 
-def _call_gpt_latex(prompt: str, transcript: str, client: OpenAI) -> str:
-    response = client.responses.create(
-        model="gpt-4.1",
-        input=[
+def _latex_request_body(key: str, prompt: str, transcript: str) -> dict:
+    """Responses API payload shared by the synchronous and batch paths."""
+
+    return {
+        "model": _LATEX_MODEL,
+        # Routes requests sharing a system prompt to the same prompt cache.
+        "prompt_cache_key": f"vi-latex-{key}-v{LATEX_PROMPT_VERSION}",
+        "input": [
             {"role": "system", "content": prompt},
             {
                 "role": "user",
                 "content": f"BEGIN_TRANSCRIPT\n{transcript}\nEND_TRANSCRIPT",
             },
         ],
-    )
+    }
+
+
+async def _call_gpt_latex(key: str, prompt: str, transcript: str, client: AsyncOpenAI) -> str:
+    body = _latex_request_body(key, prompt, transcript)
+    # This loop owns retries; the SDK's own would multiply every attempt's request.
+    api = client.with_options(max_retries=0)
+    attempt = 0
+    while True:
+        try:
+            response = await api.responses.create(**body, timeout=_GPT_TIMEOUT_S)
+        except RETRYABLE_API_ERRORS as exc:
+            attempt += 1
+            if attempt >= _GPT_ATTEMPTS:
+                raise DocumentGenerationError(
+                    f"GPT request failed after {attempt} attempts: {exc}"
+                ) from exc
+            await asyncio.sleep(_RETRY_BASE_DELAY_S * 2 ** (attempt - 1))
+            continue
+        break
+
     text = _extract_response_text(response)
     if not text.strip():
         raise DocumentGenerationError("GPT returned an empty LaTeX document.")
@@ -397,13 +601,18 @@ def _call_gpt_latex(prompt: str, transcript: str, client: OpenAI) -> str:
 def _extract_response_text(response: object) -> str:
     """Best-effort extraction of text from OpenAI response objects."""
 
+    # The SDK's Response objects always expose output_text; only legacy shapes fall through.
+    output_text = getattr(response, "output_text", None)
+    if isinstance(output_text, str) and output_text:
+        return output_text
+
     if isinstance(response, str):
         return response
 
     for attr in ("output_text", "text"):
         value = getattr(response, attr, None)
         if isinstance(value, list):
-            return "".join(str(part) for part in value)
+            return "".join([str(part) for part in value])
         if isinstance(value, str):
             return value
 
@@ -422,31 +631,115 @@ def _extract_response_text(response: object) -> str:
     return str(response)
 
 
-def _compile_pdf(latex: str) -> bytes:
-    with TemporaryDirectory() as tmpdir:
+def _extract_batch_output_text(body: dict) -> str:
+    """Pull the text out of a raw Responses API body from a batch output file."""
+
+    texts: list[str] = []
+    for item in body.get("output") or []:
+        for block in item.get("content") or []:
+            if block.get("type") == "output_text" and block.get("text"):
+                texts.append(block["text"])
+    return "".join(texts)
+
+
+def compile_pdf(latex: str) -> bytes:
+    """Compile a LaTeX document with pdflatex and return the PDF bytes."""
+
+    with TemporaryDirectory(dir=_TEX_SCRATCH_ROOT) as tmpdir:
         tex_path = f"{tmpdir}/document.tex"
-        with open(tex_path, "w", encoding="utf-8") as handle:
-            handle.write(latex)
-
-        for run in range(2):
-            proc = subprocess.run(
-                ["pdflatex", "-halt-on-error", "-interaction=nonstopmode", "document.tex"],
-                cwd=tmpdir,
-                capture_output=True,
-                text=False,
-                check=False,
-            )
-            if proc.returncode != 0:
-                stdout = proc.stdout.decode("utf-8", errors="replace") if proc.stdout else ""
-                stderr = proc.stderr.decode("utf-8", errors="replace") if proc.stderr else ""
-                raise DocumentGenerationError(
-                    "pdflatex failed: " + (stderr or stdout or "unknown error")
-                )
-            # First pass generates TOC/aux data; continue to second pass automatically.
+        with open(tex_path, "wb") as handle:
+            handle.write(latex.encode("utf-8"))
+
+        # The first pass only collects TOC/label data, so skip PDF output with -draftmode.
+        # Further full passes run only while that data keeps changing.
+        previous_digest: Optional[bytes] = None
+        for pass_index in range(_MAX_PDFLATEX_PASSES):
+            draft = pass_index == 0
+            log = _run_pdflatex(tmpdir, draft=draft)
+            digest = _aux_digest(tmpdir)
+            if not draft and digest == previous_digest and not _log_requests_rerun(log):
+                break
+            previous_digest = digest
 
         pdf_path = f"{tmpdir}/document.pdf"
         try:
-            with open(pdf_path, "rb") as pdf_handle:
-                return pdf_handle.read()
+            # Unbuffered readall() sizes its buffer from fstat, so the PDF is read in one go.
+            with open(pdf_path, "rb", buffering=0) as pdf_handle:
+                return pdf_handle.readall()
         except FileNotFoundError as exc:  # pragma: no cover
             raise DocumentGenerationError("pdflatex did not produce a PDF file.") from exc
+
+
+def _run_pdflatex(workdir: str, *, draft: bool) -> bytes:
+    """Run one pdflatex pass over document.tex and return the resulting log."""
+
+    # batchmode keeps pdflatex silent on the terminal; everything we need is in the log.
+    cmd = ["pdflatex", "-halt-on-error", "-interaction=batchmode"]
+    if draft:
+        cmd.append("-draftmode")
+    cmd.append("document.tex")
+
+    proc = subprocess.run(
+        cmd,
+        cwd=workdir,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        check=False,
+    )
+    try:
+        with open(f"{workdir}/document.log", "rb") as log_handle:
+            log = log_handle.read()
+    except FileNotFoundError:
+        log = b""
+
+    if proc.returncode != 0:
+        stderr = proc.stderr.decode("utf-8", errors="replace") if proc.stderr else ""
+        raise DocumentGenerationError(
+            "pdflatex failed: " + (_latex_error_excerpt(log) or stderr or "unknown error")
+        )
+    return log
+
+
+def _latex_error_excerpt(log: bytes, context_lines: int = 8) -> str:
+    """Return the first TeX error ("! ..." line) from a log plus a few lines of context."""
+
+    lines = log.decode("utf-8", errors="replace").splitlines()
+    for index, line in enumerate(lines):
+        if line.startswith("!"):
+            return "\n".join(lines[index : index + context_lines]).strip()
+    return ""
+
+
+def _log_requests_rerun(log: bytes) -> bool:
+    r"""Return True when a pdflatex log asks for another pass.
+
+    TeX hard-wraps log lines (mid-word if needed), so line breaks are removed first.
+
+    >>> _log_requests_rerun(b"Package: rerunfilecheck 2022/07/10 v1.10 Rerun checks for "
+    ...     b"auxiliary files (HO)\n")
+    False
+    >>> _log_requests_rerun(b"LaTeX Warning: Label(s) may have changed. Rerun to get cross-refe"
+    ...     b"\nrences right.\n")
+    True
+    >>> _log_requests_rerun(b"Package rerunfilecheck Warning: File `document.out' has changed.\n"
+    ...     b"(rerunfilecheck)                Rerun to get outlines right\n")
+    True
+    >>> _log_requests_rerun(b"Package longtable Warning: Table widths have changed. Rer\nun LaTeX.")
+    True
+    """
+
+    return _RERUN_PATTERN.search(log.replace(b"\n", b"")) is not None
+
+
+def _aux_digest(workdir: str) -> bytes:
+    """Hash the auxiliary files a following pass would read back in."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for suffix in _AUX_SUFFIXES:
+        try:
+            with open(f"{workdir}/document{suffix}", "rb") as handle:
+                digest.update(handle.read())
+        except FileNotFoundError:
+            pass
+        digest.update(b"\0")
+    return digest.digest()
@@ -0,0 +1,14 @@
+"""Streamlit-backed memoization for the LaTeX post-processing steps."""
+
+from __future__ import annotations
+
+import streamlit as st
+
+from vi_speech_to_text.postprocess import compile_pdf
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def compile_pdf_cached(latex: str) -> bytes:
+    """Compile LaTeX to PDF, reusing the bytes from an earlier compile of the same source."""
+
+    return compile_pdf(latex)
@@ -2,37 +2,85 @@
 
 from __future__ import annotations
 
-import json
+import bisect
+import functools
+import io
+import mmap
 import os
+import queue
 import shutil
 import subprocess
 import tempfile
+import threading
+import time
+import wave
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
 from io import BytesIO
 from pathlib import Path
-from typing import BinaryIO, Iterable, Iterator, Optional
+from typing import BinaryIO, Generator, Iterable, Iterator, Optional, Sequence, TypeVar
 
 from openai import OpenAI
 
-from vi_speech_to_text.openai_client import create_openai_client
+from vi_speech_to_text.openai_client import RETRYABLE_API_ERRORS, create_openai_client
 
 # API limits uploads to 25 MB so stay below that for safety.
 _MAX_CHUNK_BYTES = 24 * 1024 * 1024
 _MIN_CHUNK_MS = 5_000  # never split into segments shorter than 5 seconds unless needed.
 # ChatGPT rejects audio longer than ~1,400 seconds per request, so stay below this too.
 _MAX_CHUNK_DURATION_MS = 1_300_000
-_SUPPORTED_EXTENSIONS = {
-    "mp3",
-    "mp4",
-    "mpeg",
-    "mpga",
-    "m4a",
-    "ogg",
-    "wav",
-    "webm",
+# Chunk lengths follow an exponentially weighted byte rate observed on earlier chunks and
+# aim this fraction below the byte limit, so the shrink-and-retry path is rarely needed.
+_BYTE_RATE_SMOOTHING = 0.2
+_CHUNK_SIZE_MARGIN = 0.95
+# Default transcription requests in flight at once; each holds one exported chunk (up to
+# ~24 MB) in memory.
+_DEFAULT_CONCURRENCY = 4
+# Exported chunks allowed to wait for a free upload slot while ffmpeg keeps cutting.
+_EXPORT_PREFETCH_DEPTH = 2
+_TRANSCRIPTION_ATTEMPTS = 3
+_RETRY_BASE_DELAY_S = 1.0
+# Uploads are spooled to disk through one reusable buffer of this size.
+_COPY_BLOCK_BYTES = 1024 * 1024
+# Buffer size for reading ffmpeg/ffprobe pipes; chunk payloads run to tens of megabytes.
+_PIPE_BUFFER_BYTES = 1 << 20
+_SUPPORTED_EXTENSIONS = frozenset(
+    {
+        "mp3",
+        "mp4",
+        "mpeg",
+        "mpga",
+        "m4a",
+        "ogg",
+        "wav",
+        "webm",
+    }
+)
+_SUPPORTED_EXTENSIONS_SORTED = tuple(sorted(_SUPPORTED_EXTENSIONS))
+_UNSUPPORTED_MSG = "Unsupported audio type. Please upload one of: " + ", ".join(
+    _SUPPORTED_EXTENSIONS_SORTED
+)
+
+# Output flags that stream-copy the audio instead of re-encoding it. Seeking with -ss before
+# -i lands on packet boundaries, so copied chunks start cleanly. WAV is left out: its default
+# pcm_s16le encoder is already a plain copy for typical 16-bit input.
+_STREAM_COPY_ARGS: dict[str, tuple[str, ...]] = {
+    "mp3": ("-c:a", "copy"),
+    "mp4": ("-c:a", "copy", "-avoid_negative_ts", "make_zero"),
+    "ogg": ("-c:a", "copy"),
+    "webm": ("-c:a", "copy"),
 }
 
+# Stream copy needs no decoder parameters and ffprobe already identified the input, so the
+# per-chunk copy attempt skips ffmpeg's input probing. Re-encoding keeps the full probe.
+_FAST_START_INPUT_ARGS = ("-probesize", "32", "-analyzeduration", "0")
+
+# Containers ffmpeg can write to a non-seekable pipe without losing header data. MP4 needs
+# to seek back for its moov atom and WAV for its RIFF sizes, so those still use a temp file.
+_PIPE_EXPORT_FORMATS = {"mp3", "ogg", "webm"}
+
 _EXPORT_FORMAT_OVERRIDES = {
     # Map file extensions to the FFmpeg format names that successfully round trip.
     "m4a": "mp4",
@@ -41,6 +89,9 @@ _EXPORT_FORMAT_OVERRIDES = {
 }
 
 
+_T = TypeVar("_T")
+
+
 class UnsupportedAudioFormatError(ValueError):
     """Raised when a provided audio file has an unsupported extension."""
 
@@ -66,18 +117,54 @@ class ChunkTranscript:
 class _PreparedAudioFile:
     path: str
     size_bytes: int
+    # True when the upload was spooled to a throwaway temp file rather than read in place.
+    is_temporary: bool = False
 
 
-@dataclass
+@dataclass(frozen=True)
 class _AudioMetadata:
     duration_ms: int
     bit_rate: Optional[int]
 
 
+class _MappedChunk(io.RawIOBase):
+    """Read-only, seekable file object over a memory-mapped chunk export."""
+
+    def __init__(self, mapped: mmap.mmap) -> None:
+        super().__init__()
+        self._mapped = mapped
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return self._mapped.read(size)
+
+    def readinto(self, buffer) -> int:  # type: ignore[override]
+        data = self._mapped.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._mapped.seek(offset, whence)
+        return self._mapped.tell()
+
+    def tell(self) -> int:
+        return self._mapped.tell()
+
+    def close(self) -> None:
+        if not self.closed:
+            self._mapped.close()
+        super().close()
+
+
 def supported_audio_extensions() -> Iterable[str]:
     """Return the audio extensions the UI can ingest."""
 
-    return tuple(sorted(_SUPPORTED_EXTENSIONS))
+    return _SUPPORTED_EXTENSIONS_SORTED
 
 
 def chunked_transcription(
@@ -88,15 +175,21 @@ def chunked_transcription(
     client: Optional[OpenAI] = None,
     model: str = "gpt-4o-transcribe",
     max_chunk_bytes: int = _MAX_CHUNK_BYTES,
+    concurrency: int = _DEFAULT_CONCURRENCY,
 ) -> Iterator[ChunkTranscript]:
-    """Transcribe an uploaded file chunk-by-chunk."""
+    """Transcribe an uploaded file chunk-by-chunk, with up to concurrency uploads in flight."""
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
 
     audio_format = _infer_audio_format(filename)
     api_client = client or create_openai_client()
     prompt_value = prompt.strip() or None
 
     with _prepare_local_audio_file(file) as prepared_file:
-        metadata = _probe_audio_metadata(prepared_file.path)
+        metadata = _probe_audio_metadata(
+            prepared_file.path, cacheable=not prepared_file.is_temporary
+        )
         total_ms = metadata.duration_ms
         approx_chunk_ms = _estimate_chunk_duration(
             duration_ms=metadata.duration_ms,
@@ -105,37 +198,153 @@ def chunked_transcription(
             max_chunk_bytes=max_chunk_bytes,
         )
 
-        for chunk_index, start_ms, end_ms, payload in _generate_chunks(
-            input_path=prepared_file.path,
-            audio_format=audio_format,
-            approx_chunk_ms=approx_chunk_ms,
-            total_ms=total_ms,
-            max_chunk_bytes=max_chunk_bytes,
-        ):
-            response = api_client.audio.transcriptions.create(
+        # ffmpeg exports chunks on a background thread while earlier chunks are transcribed
+        # concurrently; results are still yielded in chunk order so callers can append them
+        # as they arrive.
+        chunks = _prefetch(
+            _generate_chunks(
+                input_path=prepared_file.path,
+                audio_format=audio_format,
+                approx_chunk_ms=approx_chunk_ms,
+                total_ms=total_ms,
+                max_chunk_bytes=max_chunk_bytes,
+            ),
+            depth=_EXPORT_PREFETCH_DEPTH,
+        )
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        pending: deque[tuple[int, int, int, Future[str]]] = deque()
+        try:
+            for chunk_index, start_ms, end_ms, payload in chunks:
+                future = executor.submit(
+                    _transcribe_chunk, api_client, payload, model=model, prompt=prompt_value
+                )
+                pending.append((chunk_index, start_ms, end_ms, future))
+                while pending and (
+                    pending[0][3].done() or len(pending) >= concurrency
+                ):
+                    yield _finish_chunk(*pending.popleft(), total_ms=total_ms)
+
+            while pending:
+                yield _finish_chunk(*pending.popleft(), total_ms=total_ms)
+        finally:
+            # Stop the exporter before the prepared audio file is cleaned up.
+            chunks.close()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def chunked_transcription_stream(
+    *,
+    file: BinaryIO,
+    filename: str,
+    prompt: str = "",
+    client: Optional[OpenAI] = None,
+    model: str = "gpt-4o-transcribe",
+    max_chunk_bytes: int = _MAX_CHUNK_BYTES,
+    concurrency: int = _DEFAULT_CONCURRENCY,
+) -> Iterator[tuple[float, str]]:
+    """Yield (progress, text) per chunk; collect the texts in a list and join them once."""
+
+    for chunk in chunked_transcription(
+        file=file,
+        filename=filename,
+        prompt=prompt,
+        client=client,
+        model=model,
+        max_chunk_bytes=max_chunk_bytes,
+        concurrency=concurrency,
+    ):
+        yield chunk.progress, chunk.text
+
+
+def _prefetch(iterator: Iterator[_T], *, depth: int) -> Iterator[_T]:
+    """Drive iterator on a background thread, keeping up to depth items ready ahead."""
+
+    ready: queue.Queue[tuple[bool, object]] = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry: tuple[bool, object]) -> bool:
+        while not stop.is_set():
+            try:
+                ready.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in iterator:
+                if not put((True, item)):
+                    return
+            put((False, None))
+        except BaseException as exc:  # surfaced on the consumer thread
+            put((False, exc))
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    producer = threading.Thread(target=produce, name="chunk-export", daemon=True)
+    producer.start()
+    try:
+        while True:
+            has_item, value = ready.get()
+            if not has_item:
+                if value is not None:
+                    raise value  # type: ignore[misc]
+                return
+            yield value  # type: ignore[misc]
+    finally:
+        stop.set()
+        producer.join()
+
+
+def _transcribe_chunk(
+    client: OpenAI, payload: BinaryIO, *, model: str, prompt: Optional[str]
+) -> str:
+    """Send one chunk to the API, retrying transient failures with exponential backoff."""
+
+    # This loop owns retries; the SDK's own would multiply every attempt's upload.
+    api = client.with_options(max_retries=0)
+    attempt = 0
+    while True:
+        payload.seek(0)
+        try:
+            response = api.audio.transcriptions.create(
                 model=model,
                 file=payload,
                 response_format="text",
-                prompt=prompt_value,
-            )
-            text = _extract_transcript_text(response)
-            yield ChunkTranscript(
-                chunk_index=chunk_index,
-                start_ms=start_ms,
-                end_ms=end_ms,
-                total_ms=total_ms,
-                text=text,
+                prompt=prompt,
             )
+        except RETRYABLE_API_ERRORS:
+            attempt += 1
+            if attempt >= _TRANSCRIPTION_ATTEMPTS:
+                raise
+            time.sleep(_RETRY_BASE_DELAY_S * 2 ** (attempt - 1))
+            continue
+        # response_format="text" comes back from the SDK as a plain str.
+        if isinstance(response, str):
+            return _trim_transcript(response)
+        return _extract_transcript_text(response)
+
+
+def _finish_chunk(
+    chunk_index: int, start_ms: int, end_ms: int, future: Future[str], *, total_ms: int
+) -> ChunkTranscript:
+    return ChunkTranscript(
+        chunk_index=chunk_index,
+        start_ms=start_ms,
+        end_ms=end_ms,
+        total_ms=total_ms,
+        text=future.result(),
+    )
 
 
 def _infer_audio_format(filename: str) -> str:
     suffix = Path(filename).suffix.lower().lstrip(".")
     if suffix in _SUPPORTED_EXTENSIONS:
         return suffix
-    raise UnsupportedAudioFormatError(
-        "Unsupported audio type. Please upload one of: "
-        + ", ".join(sorted(_SUPPORTED_EXTENSIONS))
-    )
+    raise UnsupportedAudioFormatError(_UNSUPPORTED_MSG)
 
 
 @contextmanager
@@ -150,12 +359,13 @@ def _prepare_local_audio_file(file: BinaryIO) -> Iterator[_PreparedAudioFile]:
         return
 
     with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-        shutil.copyfileobj(file, tmp_file)
+        _spool_to_file(file, tmp_file)
+        tmp_file.flush()
+        size_bytes = os.fstat(tmp_file.fileno()).st_size
         tmp_path = tmp_file.name
 
-    size_bytes = os.path.getsize(tmp_path)
     try:
-        yield _PreparedAudioFile(path=tmp_path, size_bytes=size_bytes)
+        yield _PreparedAudioFile(path=tmp_path, size_bytes=size_bytes, is_temporary=True)
     finally:
         try:
             os.remove(tmp_path)
@@ -163,17 +373,60 @@ def _prepare_local_audio_file(file: BinaryIO) -> Iterator[_PreparedAudioFile]:
             pass
 
 
-def _probe_audio_metadata(path: str) -> _AudioMetadata:
-    """Return quick metadata for the provided audio file via ffprobe."""
+def _spool_to_file(source: BinaryIO, target: BinaryIO) -> None:
+    """Copy source into target in 1 MiB blocks through a single preallocated buffer."""
+
+    getbuffer = getattr(source, "getbuffer", None)
+    if getbuffer is not None:
+        # In-memory uploads (Streamlit's UploadedFile is a BytesIO) go out in one write.
+        with getbuffer() as view:
+            target.write(view[source.tell() :])
+        return
+
+    readinto = getattr(source, "readinto", None)
+    if readinto is None:
+        shutil.copyfileobj(source, target, _COPY_BLOCK_BYTES)
+        return
+
+    view = memoryview(bytearray(_COPY_BLOCK_BYTES))
+    while True:
+        count = readinto(view)
+        if not count:
+            break
+        target.write(view[:count])
+
+
+def _probe_audio_metadata(path: str, *, cacheable: bool = False) -> _AudioMetadata:
+    """Return quick metadata for the provided audio file via ffprobe.
 
+    Only caller-owned files are cacheable: spooled uploads get a fresh temp path on every
+    run, so caching them would never hit and would only pin entries for deleted files.
+    """
+
+    if not cacheable:
+        return _run_metadata_probe(path)
+    stat = os.stat(path)
+    return _probe_audio_metadata_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _probe_audio_metadata_cached(path: str, mtime_ns: int, size_bytes: int) -> _AudioMetadata:
+    """Probe path once per (mtime, size) so re-runs on the same file skip ffprobe."""
+
+    return _run_metadata_probe(path)
+
+
+def _run_metadata_probe(path: str) -> _AudioMetadata:
     cmd = [
         "ffprobe",
         "-v",
         "error",
+        "-select_streams",
+        "a:0",
         "-show_entries",
-        "format=duration,bit_rate:stream=duration,bit_rate",
+        "format=duration,bit_rate",
         "-of",
-        "json",
+        "default=noprint_wrappers=1:nokey=1",
         path,
     ]
     try:
@@ -183,56 +436,64 @@ def _probe_audio_metadata(path: str) -> _AudioMetadata:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            bufsize=_PIPE_BUFFER_BYTES,
         )
     except FileNotFoundError as exc:  # pragma: no cover - depends on system ffmpeg
         raise RuntimeError("ffprobe is required but was not found on PATH.") from exc
     except subprocess.CalledProcessError as exc:  # pragma: no cover - ffprobe failure
         raise ValueError("Unable to inspect the provided audio file.") from exc
 
-    try:
-        data = json.loads(completed.stdout or "{}")
-    except json.JSONDecodeError as exc:  # pragma: no cover - unexpected ffprobe output
-        raise ValueError("Received malformed metadata from ffprobe.") from exc
-
-    duration_seconds = _extract_duration_seconds(data)
+    # One bare value per line, duration then bit rate; missing values print as "N/A".
+    values = completed.stdout.split()
+    duration_seconds = _safe_float(values[0]) if values else None
     if duration_seconds is None or duration_seconds <= 0:
         raise ValueError("Unable to determine audio duration from the provided file.")
-    bit_rate = _extract_bit_rate(data)
+    bit_rate = _safe_int(values[1]) if len(values) > 1 else None
 
     duration_ms = max(int(duration_seconds * 1000), 1)
     return _AudioMetadata(duration_ms=duration_ms, bit_rate=bit_rate)
 
 
-def _extract_duration_seconds(data: dict) -> Optional[float]:
-    sources = []
-    if isinstance(data.get("format"), dict):
-        sources.append(data["format"].get("duration"))
-    if isinstance(data.get("streams"), list):
-        for stream in data["streams"]:
-            if isinstance(stream, dict):
-                sources.append(stream.get("duration"))
-
-    for value in sources:
-        duration = _safe_float(value)
-        if duration:
-            return duration
-    return None
+def _probe_keyframes_ms(path: str, *, start_ms: int = 0) -> tuple[int, ...]:
+    """Return sorted keyframe timestamps (ms) of the first audio stream from start_ms on.
 
+    Lists every packet in that range, so it is only run when chunks must be cut one by one.
+    Returns () if unknown.
+    """
 
-def _extract_bit_rate(data: dict) -> Optional[int]:
-    candidates = []
-    if isinstance(data.get("format"), dict):
-        candidates.append(data["format"].get("bit_rate"))
-    if isinstance(data.get("streams"), list):
-        for stream in data["streams"]:
-            if isinstance(stream, dict):
-                candidates.append(stream.get("bit_rate"))
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "a:0",
+        "-show_entries",
+        "packet=pts_time,flags",
+        "-of",
+        "csv=p=0",
+    ]
+    if start_ms > 0:
+        cmd.extend(["-read_intervals", f"{_format_ms(start_ms)}%"])
+    cmd.append(path)
+    try:
+        completed = subprocess.run(
+            cmd,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=_PIPE_BUFFER_BYTES,
+        )
+    except (OSError, subprocess.CalledProcessError):  # pragma: no cover - optional probe
+        return ()
 
-    for value in candidates:
-        bit_rate = _safe_int(value)
-        if bit_rate:
-            return bit_rate
-    return None
+    keyframes = set()
+    for line in completed.stdout.splitlines():
+        pts_time, _, flags = line.partition(",")
+        pts_seconds = _safe_float(pts_time)
+        if pts_seconds is not None and pts_seconds > 0 and flags.startswith("K"):
+            keyframes.add(int(pts_seconds * 1000))
+    return tuple(sorted(keyframes))
 
 
 def _export_chunk(
@@ -242,11 +503,67 @@ def _export_chunk(
     chunk_extension: str,
     start_ms: int,
     duration_ms: int,
-) -> BytesIO:
+) -> BinaryIO:
     """Use ffmpeg to export a time-bounded slice of the source file."""
 
-    start_seconds = max(start_ms, 0) / 1000.0
-    duration_seconds = max(duration_ms, 1) / 1000.0
+    if export_format == "wav":
+        try:
+            return _slice_wav(input_path, start_ms=start_ms, duration_ms=duration_ms)
+        except (wave.Error, EOFError):
+            # Non-PCM or unusual WAV layouts are left to ffmpeg.
+            pass
+
+    export_args = dict(
+        input_path=input_path,
+        export_format=export_format,
+        chunk_extension=chunk_extension,
+        start_ms=start_ms,
+        duration_ms=duration_ms,
+    )
+    copy_args = _STREAM_COPY_ARGS.get(export_format)
+    if copy_args:
+        try:
+            return _run_ffmpeg_export(
+                **export_args,
+                input_args=_FAST_START_INPUT_ARGS,
+                codec_args=(*copy_args, "-threads", "1"),
+            )
+        except ValueError:
+            # Some sources cannot be stream-copied into the target container; re-encode.
+            pass
+    return _run_ffmpeg_export(**export_args, codec_args=())
+
+
+def _slice_wav(input_path: str, *, start_ms: int, duration_ms: int) -> BytesIO:
+    """Copy a PCM frame range into a new WAV file in memory without spawning ffmpeg."""
+
+    with wave.open(input_path, "rb") as source:
+        params = source.getparams()
+        start_frame = min(max(start_ms, 0) * params.framerate // 1000, params.nframes)
+        frame_count = max(duration_ms, 1) * params.framerate // 1000
+        source.setpos(start_frame)
+        frames = source.readframes(min(frame_count, params.nframes - start_frame))
+
+    frame_width = params.nchannels * params.sampwidth
+    payload = BytesIO()
+    with wave.open(payload, "wb") as target:
+        # The exact frame count up front means the header is never rewritten.
+        target.setparams(params._replace(nframes=len(frames) // frame_width))
+        target.writeframesraw(frames)
+    payload.seek(0)
+    return payload
+
+
+def _run_ffmpeg_export(
+    *,
+    input_path: str,
+    export_format: str,
+    chunk_extension: str,
+    start_ms: int,
+    duration_ms: int,
+    codec_args: Sequence[str],
+    input_args: Sequence[str] = (),
+) -> BinaryIO:
     output_flags: list[str] = []
     if export_format in {"mp4"}:
         output_flags.extend(["-movflags", "frag_keyframe+empty_moov"])
@@ -257,45 +574,83 @@ def _export_chunk(
         "-hide_banner",
         "-loglevel",
         "error",
+        "-ignore_unknown",
+        *input_args,
         "-ss",
-        f"{start_seconds:.6f}",
+        _format_ms(max(start_ms, 0)),
         "-t",
-        f"{duration_seconds:.6f}",
+        _format_ms(max(duration_ms, 1)),
         "-i",
         input_path,
     ]
     cmd.extend(output_flags)
-    cmd.extend(["-vn"])
+    # Only the first audio stream matters; skip cover art, extra tracks and subtitle/data.
+    cmd.extend(["-map", "0:a:0", "-vn", "-sn", "-dn"])
+    cmd.extend(codec_args)
+    cmd.extend(["-f", export_format])
+
+    if export_format in _PIPE_EXPORT_FORMATS:
+        # Streamable containers go straight to stdout: no temp file write + read back.
+        return BytesIO(_run_ffmpeg([*cmd, "pipe:1"]))
 
     tmp_file = tempfile.NamedTemporaryFile(suffix=f".{chunk_extension}", delete=False)
     tmp_file.close()
-    cmd.extend(["-f", export_format, "-y", tmp_file.name])
-    try:
-        subprocess.run(
-            cmd,
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-    except FileNotFoundError as exc:  # pragma: no cover - depends on system ffmpeg
-        raise RuntimeError("ffmpeg is required but was not found on PATH.") from exc
-    except subprocess.CalledProcessError as exc:  # pragma: no cover - ffmpeg failure
-        stderr_text = (exc.stderr or b"").decode("utf-8", errors="ignore").strip()
-        raise ValueError(
-            "Unable to export audio chunk via ffmpeg." + (f" {stderr_text}" if stderr_text else "")
-        ) from exc
-
     try:
-        with open(tmp_file.name, "rb") as tmp_in:
-            payload = BytesIO(tmp_in.read())
+        _run_ffmpeg([*cmd, "-y", tmp_file.name])
+        return _load_exported_chunk(tmp_file.name)
     finally:
         try:
             os.remove(tmp_file.name)
         except FileNotFoundError:
             pass
 
-    payload.seek(0)
-    return payload
+
+def _load_exported_chunk(path: str) -> BinaryIO:
+    """Memory-map an exported chunk file, or read it into memory where mapping won't do."""
+
+    with open(path, "rb", buffering=0) as tmp_in:
+        # POSIX keeps the mapping valid after the file is closed and unlinked, so the upload
+        # streams straight from the page cache. Windows cannot unlink a mapped file.
+        if os.name == "posix" and os.fstat(tmp_in.fileno()).st_size:
+            return _MappedChunk(mmap.mmap(tmp_in.fileno(), 0, access=mmap.ACCESS_READ))
+        # FileIO sizes one allocation from fstat and BytesIO shares it.
+        return BytesIO(tmp_in.readall())
+
+
+def _format_ms(value_ms: int) -> str:
+    """Render whole milliseconds as an exact ffmpeg seconds string, e.g. 61250 -> "61.250"."""
+
+    return f"{value_ms // 1000}.{value_ms % 1000:03d}"
+
+
+def _run_ffmpeg(cmd: list[str]) -> bytes:
+    """Run ffmpeg and return everything it wrote to stdout."""
+
+    # stderr goes to a temp file so stdout can be drained with one large-buffered read
+    # instead of communicate()'s 32 KiB select loop, without risking a full stderr pipe.
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            proc = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                bufsize=_PIPE_BUFFER_BYTES,
+            )
+        except FileNotFoundError as exc:  # pragma: no cover - depends on system ffmpeg
+            raise RuntimeError("ffmpeg is required but was not found on PATH.") from exc
+
+        with proc:
+            stdout = proc.stdout.read() if proc.stdout else b""
+            returncode = proc.wait()
+
+        if returncode != 0:  # pragma: no cover - ffmpeg failure
+            stderr_file.seek(0)
+            stderr_text = stderr_file.read().decode("utf-8", errors="ignore").strip()
+            raise ValueError(
+                "Unable to export audio chunk via ffmpeg."
+                + (f" {stderr_text}" if stderr_text else "")
+            )
+    return stdout
 
 
 def _generate_chunks(
@@ -305,14 +660,35 @@ def _generate_chunks(
     approx_chunk_ms: int,
     total_ms: int,
     max_chunk_bytes: int,
-) -> Iterator[tuple[int, int, int, BytesIO]]:
+) -> Iterator[tuple[int, int, int, BinaryIO]]:
     export_format, chunk_extension = _resolve_export_settings(audio_format)
 
     start_ms = 0
     chunk_index = 0
+    if export_format in _STREAM_COPY_ARGS:
+        start_ms, chunk_index = yield from _generate_segmented_chunks(
+            input_path=input_path,
+            export_format=export_format,
+            chunk_extension=chunk_extension,
+            segment_ms=min(int(approx_chunk_ms * _CHUNK_SIZE_MARGIN), _MAX_CHUNK_DURATION_MS),
+            total_ms=total_ms,
+            max_chunk_bytes=max_chunk_bytes,
+        )
+
+    # Whatever the segmenter did not cover is exported one ffmpeg run per chunk. The byte
+    # rate is seeded from the bitrate-based estimate, then refined with each exported chunk.
+    keyframes_ms: Sequence[int] = ()
+    if export_format in _STREAM_COPY_ARGS and start_ms < total_ms:
+        # Stream-copied cuts snap to keyframes, listed only from where the segmenter stopped.
+        keyframes_ms = _probe_keyframes_ms(input_path, start_ms=start_ms)
+    bytes_per_ms = max_chunk_bytes / max(approx_chunk_ms, 1)
     while start_ms < total_ms:
         remaining_ms = total_ms - start_ms
-        target_duration = min(approx_chunk_ms, remaining_ms, _MAX_CHUNK_DURATION_MS)
+        predicted_ms = int(max_chunk_bytes * _CHUNK_SIZE_MARGIN / bytes_per_ms)
+        target_duration = min(
+            max(predicted_ms, _MIN_CHUNK_MS), remaining_ms, _MAX_CHUNK_DURATION_MS
+        )
+        target_duration = _snap_to_keyframe(start_ms, target_duration, total_ms, keyframes_ms)
 
         while True:
             payload = _export_chunk(
@@ -322,11 +698,14 @@ def _generate_chunks(
                 start_ms=start_ms,
                 duration_ms=target_duration,
             )
-            size = payload.getbuffer().nbytes
+            size = payload.seek(0, os.SEEK_END)
+            payload.seek(0)
 
             if size <= max_chunk_bytes:
-                payload.name = f"chunk-{chunk_index}.{chunk_extension}"
-                yield chunk_index, start_ms, start_ms + target_duration, payload
+                bytes_per_ms += _BYTE_RATE_SMOOTHING * (size / target_duration - bytes_per_ms)
+                yield _name_chunk(
+                    chunk_index, start_ms, start_ms + target_duration, payload, chunk_extension
+                )
                 start_ms += target_duration
                 chunk_index += 1
                 break
@@ -340,6 +719,125 @@ def _generate_chunks(
 
             # Stay defensive in case we ever increase the approximate chunk size later.
             target_duration = min(target_duration, _MAX_CHUNK_DURATION_MS)
+            target_duration = _snap_to_keyframe(start_ms, target_duration, total_ms, keyframes_ms)
+
+
+def _generate_segmented_chunks(
+    *,
+    input_path: str,
+    export_format: str,
+    chunk_extension: str,
+    segment_ms: int,
+    total_ms: int,
+    max_chunk_bytes: int,
+) -> Generator[tuple[int, int, int, BinaryIO], None, tuple[int, int]]:
+    """Stream-copy every chunk in a single ffmpeg run using the segment muxer.
+
+    Chunks are yielded as ffmpeg finishes them. Stops early if a segment exceeds the byte
+    limit or ffmpeg fails, and returns the (start_ms, chunk_index) to resume from.
+    """
+
+    with tempfile.TemporaryDirectory(prefix="vi-chunks-") as workdir:
+        cmd = [
+            "ffmpeg",
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-ignore_unknown",
+            "-i",
+            input_path,
+            "-map",
+            "0:a:0",
+            "-vn",
+            "-sn",
+            "-dn",
+            *_STREAM_COPY_ARGS[export_format],
+            "-f",
+            "segment",
+            "-segment_format",
+            export_format,
+            "-segment_time",
+            f"{max(segment_ms, _MIN_CHUNK_MS) / 1000.0:.3f}",
+            "-reset_timestamps",
+            "1",
+            # One "name,start,end" row is written per segment as soon as it is closed.
+            "-segment_list",
+            "pipe:1",
+            "-segment_list_type",
+            "csv",
+            os.path.join(workdir, f"chunk-%05d.{chunk_extension}"),
+        ]
+        try:
+            proc = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            )
+        except FileNotFoundError as exc:  # pragma: no cover - depends on system ffmpeg
+            raise RuntimeError("ffmpeg is required but was not found on PATH.") from exc
+
+        resume_ms = 0
+        chunk_index = 0
+        # The newest segment is held back until the next one (or a clean exit) confirms
+        # whether it is the last, so the final chunk can be stretched to total_ms.
+        held: Optional[tuple[int, int, BinaryIO]] = None
+        with proc:
+            try:
+                for row in proc.stdout or ():
+                    name, _, times = row.strip().partition(",")
+                    start_text, _, end_text = times.partition(",")
+                    start_s, end_s = _safe_float(start_text), _safe_float(end_text)
+                    if not name or start_s is None or end_s is None:
+                        continue
+                    segment_path = os.path.join(workdir, os.path.basename(name))
+                    try:
+                        payload = _load_exported_chunk(segment_path)
+                        os.remove(segment_path)
+                    except OSError:
+                        break
+                    if payload.seek(0, os.SEEK_END) > max_chunk_bytes:
+                        # VBR spike: the per-chunk exporter can shrink from here on.
+                        payload.close()
+                        break
+                    payload.seek(0)
+
+                    if held is not None:
+                        yield _name_chunk(chunk_index, *held, chunk_extension)
+                        resume_ms = held[1]
+                        chunk_index += 1
+                    held = (round(start_s * 1000), round(end_s * 1000), payload)
+                else:
+                    if proc.wait() == 0 and held is not None:
+                        held = (held[0], max(held[1], total_ms), held[2])
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+
+        if held is not None:
+            yield _name_chunk(chunk_index, *held, chunk_extension)
+            resume_ms = held[1]
+            chunk_index += 1
+    return resume_ms, chunk_index
+
+
+def _name_chunk(
+    chunk_index: int, start_ms: int, end_ms: int, payload: BinaryIO, chunk_extension: str
+) -> tuple[int, int, int, BinaryIO]:
+    payload.name = f"chunk-{chunk_index}.{chunk_extension}"
+    return chunk_index, start_ms, end_ms, payload
+
+
+def _snap_to_keyframe(
+    start_ms: int, duration_ms: int, total_ms: int, keyframes_ms: Sequence[int]
+) -> int:
+    """Shorten duration_ms so the chunk ends on the last keyframe at or before its end."""
+
+    end_ms = start_ms + duration_ms
+    if not keyframes_ms or end_ms >= total_ms:
+        return duration_ms
+    index = bisect.bisect_right(keyframes_ms, end_ms) - 1
+    if index < 0 or keyframes_ms[index] - start_ms < _MIN_CHUNK_MS:
+        return duration_ms
+    return keyframes_ms[index] - start_ms
 
 
 def _estimate_chunk_duration(
@@ -386,7 +884,13 @@ def _safe_float(value: object) -> Optional[float]:
 def _extract_transcript_text(response: object) -> str:
     """Normalize transcription responses to raw text."""
 
-    if isinstance(response, str):
-        return response.strip()
-    text = getattr(response, "text", "")
-    return (text or "").strip()
+    text = response if isinstance(response, str) else (getattr(response, "text", "") or "")
+    return _trim_transcript(text)
+
+
+def _trim_transcript(text: str) -> str:
+    """Strip surrounding whitespace, returning text itself when there is none."""
+
+    if text and (text[0].isspace() or text[-1].isspace()):
+        return text.strip()
+    return text